@@ -179,8 +179,9 @@ def compute_attractiveness(
         basename = "_".join([raster, "attractiveness"])
         tmp_distance_map = temporary_filename(filename=basename)
 
+    # store attractiveness as FCELL, half the size of the DCELL `exp()` yields
     distance_function = EQUATION.format(
-        result=tmp_distance_map, expression=distance_function
+        result=tmp_distance_map, expression="float({f})".format(f=distance_function)
     )
     msg = "Distance function: {f}".format(f=distance_function)
     grass.verbose(_(msg))
@@ -188,9 +189,6 @@ def compute_attractiveness(
 
     r.null(map=tmp_distance_map, null=0)  # Set NULLs to 0
 
-    compress_status = grass.read_command("r.compress", flags="g", map=tmp_distance_map)
-    grass.verbose(_("Compress status: {s}".format(s=compress_status)))  # REMOVEME
-
     return tmp_distance_map
 
 
@@ -234,7 +232,8 @@ def neighborhood_function(raster, method, size, distance_map):
         overwrite=True,
     )
 
-    scoring_function = "{neighborhood} * {distance}"
+    # store the filtered scores as FCELL, not the DCELL r.neighbors yields
+    scoring_function = "float({neighborhood} * {distance})"
     scoring_function = scoring_function.format(
         neighborhood=neighborhood_output, distance=distance_map
     )
@@ -10,6 +10,7 @@ from __future__ import absolute_import
 from __future__ import print_function
 
 import atexit
+import itertools
 import os
 
 import grass.script as grass
@@ -27,25 +28,124 @@ def run(cmd, **kwargs):
     grass.run_command(cmd, quiet=True, **kwargs)
 
 
+def verbose_message(message, **kwargs):
+    """Translate, format and print a verbose message
+
+    The message is built and printed only if the verbosity level is high
+    enough for it to be shown, sparing the string formatting and the
+    `g.message` process that `grass.verbose()` otherwise always spawns.
+
+    Parameters
+    ----------
+    message :
+        A message template, as in "Scored map {name}"
+
+    kwargs :
+        Keyword arguments to format the 'message' template
+
+    Returns
+    -------
+        Does not return any value
+
+    Examples
+    --------
+    >>> verbose_message("Scored map {name}", name=raster)
+    """
+    if grass.verbosity() > 2:
+        grass.verbose(_(message).format(**kwargs))
+
+
+def debug_message(message, level=1, **kwargs):
+    """Translate, format and print a debug message, if the debug level is
+    at least 'level'
+
+    Parameters
+    ----------
+    message :
+        A message template, as in "Maps: {maps}"
+
+    level :
+        Debug level required to print the message
+
+    kwargs :
+        Keyword arguments to format the 'message' template
+
+    Returns
+    -------
+        Does not return any value
+
+    Examples
+    --------
+    >>> debug_message("Maps: {maps}", maps=components)
+    """
+    if grass.debug_level() >= level:
+        grass.debug(_(message).format(**kwargs), level)
+
+
 def remove_map(map_name):
     """ Remove the provided map """
     grass.verbose("Removing %s" % map_name)
     g.remove(flags="f", type=("raster", "vector"), name=map_name, quiet=True)
 
 
+# maps and files to remove when the program exits
+MAPS_TO_REMOVE = []
+FILES_TO_REMOVE = []
+
+
+def remove_registered_maps():
+    """Remove all maps registered for removal in a single g.remove call
+
+    Maps are removed in reverse order of registration, as individual atexit
+    callbacks would, so that reclassed maps go before their base maps.
+    """
+    try:
+        remove_map(MAPS_TO_REMOVE[::-1])
+    except CalledModuleError:
+        grass.warning(_("Failed to remove some of {maps}".format(maps=MAPS_TO_REMOVE)))
+
+
+def remove_registered_files():
+    """ Remove all files registered for removal """
+    for filename in FILES_TO_REMOVE:
+        try:
+            os.unlink(filename)
+        except OSError:
+            grass.warning(_("Failed to remove {name}".format(name=filename)))
+
+
 def remove_map_at_exit(map_name):
-    """ Remove the provided map when the program exits """
-    atexit.register(lambda: remove_map(map_name))
+    """ Remove the provided map, or list of maps, when the program exits """
+    if not isinstance(map_name, list):
+        map_name = [map_name]
+    map_names = [name for name in map_name if name not in MAPS_TO_REMOVE]
+    if not map_names:
+        return
+    if not MAPS_TO_REMOVE:
+        atexit.register(remove_registered_maps)
+    MAPS_TO_REMOVE.extend(map_names)
 
 
 def remove_files_at_exit(filename):
     """ Remove the specified file when the program exits """
-    atexit.register(lambda: os.unlink(filename))
+    if filename in FILES_TO_REMOVE:
+        return
+    if not FILES_TO_REMOVE:
+        atexit.register(remove_registered_files)
+    FILES_TO_REMOVE.append(filename)
+
+
+# counter to number temporary filenames within the process, prefixed by its id
+TEMPORARY_FILENAME_COUNTER = itertools.count()
+TEMPORARY_FILENAME_PREFIX = "tmp.{pid}".format(pid=os.getpid())
+
+# temporary filenames handed out within the process
+TEMPORARY_FILENAMES = []
 
 
 def temporary_filename(filename=None):
-    """Returns a temporary filename using grass.script.tempfile() and
-    grass.script.basename()
+    """Returns a temporary filename made of the process id and a counter,
+    without creating a file on disk as grass.script.tempfile() does
 
     Parameters
     ----------
@@ -60,12 +160,14 @@ def temporary_filename(filename=None):
     Examples
     --------
     >>> temporary_filename(potential)
-    tmp.SomeTemporaryString.potential
+    tmp.12345.0.potential
     """
-    temporary_absolute_filename = grass.tempfile()
-    temporary_filename = "tmp." + grass.basename(temporary_absolute_filename)
+    temporary_filename = "{prefix}.{count}".format(
+        prefix=TEMPORARY_FILENAME_PREFIX, count=next(TEMPORARY_FILENAME_COUNTER)
+    )
     if filename:
         temporary_filename = temporary_filename + "." + str(filename)
+    TEMPORARY_FILENAMES.append(temporary_filename)
     return temporary_filename
 
 
@@ -83,7 +185,7 @@ def remove_temporary_maps():
     g.remove(
         flags="f",
         type="raster",
-        pattern="tmp.{pid}*".format(pid=os.getpid()),
+        pattern=TEMPORARY_FILENAME_PREFIX + "*",
         quiet=True,
     )
 
@@ -174,7 +276,37 @@ def get_univariate_statistics(raster):
     return univariate
 
 
-def recode_map(raster, rules, colors, output):
+def get_raster_range(raster):
+    """
+    Return the minimum and maximum of the input raster map
+
+    Both values are read in one call from the range stored along with the
+    raster map, instead of scanning all of its cells. Values for an empty
+    raster map are returned as `None`.
+
+    Parameters
+    ----------
+    raster :
+        Name of input raster map
+
+    Returns
+    -------
+    minimum, maximum :
+        Minimum and maximum cell value of the input raster map
+
+    Example
+    -------
+    ...
+    """
+    raster_range = grass.parse_command("r.info", flags="r", map=raster)
+    minimum, maximum = (
+        None if raster_range[key] == "NULL" else float(raster_range[key])
+        for key in ("min", "max")
+    )
+    return minimum, maximum
+
+
+def recode_map(raster, rules, colors, output, nulls_to_zero=True):
     """Scores a raster map based on a set of category recoding rules.
 
     This is a wrapper around r.recode
@@ -193,6 +325,11 @@ def recode_map(raster, rules, colors, output):
     output :
         Name of output raster map
 
+    nulls_to_zero :
+        Set the input raster map's NULL cells to 0 before recoding. Skip this
+        full rewrite of the input map for maps known to have no NULL cells,
+        i.e. distance maps derived via `r.grow.distance`.
+
     Returns
     -------
         Does not return any value
@@ -201,17 +338,18 @@ def recode_map(raster, rules, colors, output):
     --------
     ...
     """
-    msg = "Setting NULL cells in {name} map to 0"
-    msg = msg.format(name=raster)
-    grass.debug(_(msg))
-
-    # ------------------------------------------
-    r.null(map=raster, null=0)  # Set NULLs to 0
-    msg = "To Do: confirm if setting the '{raster}' map's NULL cells to 0 is right"
-    msg = msg.format(raster=raster)
-    grass.debug(_(msg))
-    # Is this right?
-    # ------------------------------------------
+    if nulls_to_zero:
+        msg = "Setting NULL cells in {name} map to 0"
+        msg = msg.format(name=raster)
+        grass.debug(_(msg))
+
+        # ------------------------------------------
+        r.null(map=raster, null=0)  # Set NULLs to 0
+        msg = "To Do: confirm if setting the '{raster}' map's NULL cells to 0 is right"
+        msg = msg.format(raster=raster)
+        grass.debug(_(msg))
+        # Is this right?
+        # ------------------------------------------
 
     r.recode(input=raster, rules=rules, output=output)
 
@@ -220,6 +358,150 @@ def recode_map(raster, rules, colors, output):
     grass.verbose(_("Scored map {name}:".format(name=raster)))
 
 
+def recode_expression(raster, rules, nulls_to_zero=True, default="null()"):
+    """Build an r.mapcalc expression that scores a raster map based on a set
+    of category recoding rules, as r.recode does, so that the scores can be
+    part of a larger expression instead of being written to a map of their
+    own.
+
+    Rules are read as 'old_low:old_high:new_low:new_high' or
+    'old_low:old_high:new_value'. Values in between 'new_low' and
+    'new_high' are interpolated linearly. Where rules overlap, the last
+    matching rule applies, as in r.recode. Open-ended rules, i.e. '*:high'
+    or 'low:*', apply only where no other rule does, the last one of each
+    side counting, as in r.recode. If all new values are integers, r.recode
+    writes a CELL map: interpolated scores are then truncated to integers,
+    here as well.
+
+    Parameters
+    ----------
+    raster :
+        Name of input raster map
+
+    rules :
+        Rules for r.recode, one per line
+
+    nulls_to_zero :
+        Score NULL cells of the input raster map as if they were 0, as
+        `recode_map()` does by setting them to 0 before recoding
+
+    default :
+        Value for cells no rule applies to
+
+    Returns
+    -------
+    expression :
+        An r.mapcalc expression, or `None` if a rule can not be expressed,
+        i.e. a rule that interpolates over an open-ended range
+
+    Examples
+    --------
+    >>> recode_expression("potential", "0:0.5:1\n0.5:1:2", nulls_to_zero=False)
+    'if(potential >= 0.5 && potential <= 1.0, 2.0, if(potential >= 0.0 && potential <= 0.5, 1.0, null()))'
+    """
+    recoding = []
+    lowest = None  # '*:high' rule, as (high, score)
+    highest = None  # 'low:*' rule, as (low, score)
+    new_values = []
+    for line in rules.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or line == "end":
+            continue
+        fields = line.split(":")
+        if len(fields) == 3:
+            fields.append(fields[2])
+        if len(fields) != 4:
+            return None
+        low, high, new_low, new_high = fields
+        try:
+            new_low, new_high = float(new_low), float(new_high)
+            if "*" in (low, high) and new_low != new_high:
+                return None
+            if low == "*" and high != "*":
+                lowest = (float(high), new_low)
+            elif high == "*" and low != "*":
+                highest = (float(low), new_low)
+            elif "*" not in (low, high):
+                low, high = float(low), float(high)
+                if low > high:
+                    low, high, new_low, new_high = high, low, new_high, new_low
+                recoding.append((low, high, new_low, new_high))
+            else:
+                return None
+        except ValueError:
+            return None
+        new_values.extend((new_low, new_high))
+
+    # r.recode writes CELL if all new values are integers, truncating
+    # interpolated values
+    integer = all(value.is_integer() for value in new_values)
+
+    def interpolate(value, low, high, new_low, new_high):
+        """Interpolate with the very operations r.recode uses, so that
+        truncated values agree, too"""
+        return (value - low) / (high - low) * (new_high - new_low) + new_low
+
+    def score(value):
+        """Score a single value, as the expression does for a cell"""
+        for low, high, new_low, new_high in reversed(recoding):
+            if low <= value <= high:
+                if new_low == new_high or low == high:
+                    return new_low
+                interpolated = interpolate(value, low, high, new_low, new_high)
+                return float(int(interpolated)) if integer else interpolated
+        if lowest and value <= lowest[0]:
+            return lowest[1]
+        if highest and value >= highest[0]:
+            return highest[1]
+        return default
+
+    # floats are formatted via repr(), which keeps all significant digits
+    # under Python 2 too
+    # open-ended rules apply only where no other rule does, '*:high' first
+    expression = str(default)
+    if highest:
+        expression = "if({raster} >= {low!r}, {score!r}, {expression})".format(
+            raster=raster, low=highest[0], score=highest[1], expression=expression
+        )
+    if lowest:
+        expression = "if({raster} <= {high!r}, {score!r}, {expression})".format(
+            raster=raster, high=lowest[0], score=lowest[1], expression=expression
+        )
+
+    for low, high, new_low, new_high in recoding:
+        condition = "{raster} >= {low!r} && {raster} <= {high!r}".format(
+            raster=raster, low=low, high=high
+        )
+        if new_low == new_high or low == high:
+            score_expression = repr(new_low)
+        else:
+            score_expression = (
+                "({raster} - {low!r}) / {width!r} * {height!r} + {new_low!r}"
+            ).format(
+                raster=raster,
+                low=low,
+                width=high - low,
+                height=new_high - new_low,
+                new_low=new_low,
+            )
+            if integer:
+                score_expression = "int({score})".format(score=score_expression)
+        # the last matching rule applies: check it first
+        expression = "if({condition}, {score}, {expression})".format(
+            condition=condition, score=score_expression, expression=expression
+        )
+
+    if nulls_to_zero:
+        # the score of NULL cells is a constant: compute it once, here
+        zero = score(0)
+        return "if(isnull({raster}), {zero}, {scores})".format(
+            raster=raster,
+            zero=repr(zero) if isinstance(zero, float) else zero,
+            scores=expression,
+        )
+    return expression
+
+
 def float_to_integer(double):
     """Converts an FCELL or DCELL raster map into a CELL raster map
 
@@ -239,7 +521,7 @@ def float_to_integer(double):
     expression = "int({double})"
     expression = expression.format(double=double)
     equation = EQUATION.format(result=double, expression=expression)
-    r.mapcalc(equation)
+    grass.mapcalc(equation)
 
 
 def update_meta(raster, title, timestamp=None):
@@ -286,12 +568,13 @@ def update_meta(raster, title, timestamp=None):
         r.timestamp(map=raster, date=timestamp)
 
 
-def export_map(input_name, title, categories, colors, output_name, timestamp):
+def export_map(input_name, title, categories, colors, timestamp):
     """
-    Export a raster map by renaming the (temporary) raster map name
-    'input_name' to the requested output raster map name 'output_name'.
-    This function is (mainly) used to export either of the intermediate
-    recreation 'potential' or 'opportunity' maps.
+    Export a raster map by attaching categories, metadata, colors and a
+    timestamp to the raster map 'input_name'. The map is expected to be
+    already written under the requested output raster map name, hence no
+    raster data are copied or renamed. This function is (mainly) used to
+    export either of the recreation 'potential' or 'opportunity' maps.
 
     Parameters
     ----------
@@ -307,13 +590,13 @@ def export_map(input_name, title, categories, colors, output_name, timestamp):
     colors :
         Colors for the output raster map
 
-    output_name :
-        Output raster map name
+    timestamp :
+        Timestamp for the output raster map
 
     Returns
     -------
-    output_name :
-        This function will return the requested 'output_name'
+    input_name :
+        This function will return the exported 'input_name'
 
     Examples
     --------
@@ -343,10 +626,8 @@ def export_map(input_name, title, categories, colors, output_name, timestamp):
     # update meta and colors
     update_meta(input_name, title, timestamp)
     r.colors(map=input_name, rules="-", stdin=colors, quiet=True)
-    # rename to requested output name
-    g.rename(raster=(input_name, output_name), quiet=True)
 
-    return output_name
+    return input_name
 
 
 def get_raster_statistics(map_one, map_two, separator, flags):
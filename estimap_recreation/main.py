@@ -69,7 +69,6 @@ def main():
     """
 
     land = options["land"]
-    land_component_map_name = temporary_filename(filename="land_component")
 
     water = options["water"]
     water_component_map_name = temporary_filename(filename="water_component")
@@ -105,9 +104,9 @@ def main():
     suitability_scores = options["suitability_scores"]
 
     if landuse and suitability_scores and ":" not in suitability_scores:
-        msg = "Suitability scores from file: {scores}."
-        msg = msg.format(scores=suitability_scores)
-        grass.verbose(_(msg))
+        verbose_message(
+            "Suitability scores from file: {scores}.", scores=suitability_scores
+        )
 
     if landuse and not suitability_scores:
         msg = "Using internal rules to score land use classes in '{map}'"
@@ -121,9 +120,10 @@ def main():
         remove_files_at_exit(suitability_scores)
 
     if landuse and suitability_scores and ":" in suitability_scores:
-        msg = "Using provided string of rules to score land use classes in {map}"
-        msg = msg.format(map=landuse)
-        grass.verbose(_(msg))
+        verbose_message(
+            "Using provided string of rules to score land use classes in {map}",
+            map=landuse,
+        )
         temporary_suitability_map_name = temporary_filename(filename=suitability_map_name)
         suitability_scores = string_to_file(
             suitability_scores, filename=temporary_suitability_map_name
@@ -141,8 +141,7 @@ def main():
         landcover = landuse
         msg = "Land cover map 'landcover' not given. "
         msg += "Attempt to use the '{landuse}' map to derive areal statistics"
-        msg = msg.format(landuse=landuse)
-        grass.verbose(_(msg))
+        verbose_message(msg, landuse=landuse)
 
     maes_ecosystem_types = "maes_ecosystem_types"
     maes_ecosystem_types_scores = "maes_ecosystem_types_scores"
@@ -154,9 +153,10 @@ def main():
         and landcover_reclassification_rules
         and ":" not in landcover_reclassification_rules
     ):
-        msg = "Land cover reclassification rules from file: {rules}."
-        msg = msg.format(rules=landcover_reclassification_rules)
-        grass.verbose(_(msg))
+        verbose_message(
+            "Land cover reclassification rules from file: {rules}.",
+            rules=landcover_reclassification_rules,
+        )
 
     # if 'land_classes' not given
     if landcover and not landcover_reclassification_rules:
@@ -167,9 +167,9 @@ def main():
         # 1. landcover is not a "MAES" land cover
         # 2. landcover is an Urban Atlas one?
 
-        msg = "Using internal rules to reclassify the '{map}' map"
-        msg = msg.format(map=landcover)
-        grass.verbose(_(msg))
+        verbose_message(
+            "Using internal rules to reclassify the '{map}' map", map=landcover
+        )
 
         temporary_maes_ecosystem_types = temporary_filename(filename=maes_ecosystem_types)
         landcover_reclassification_rules = string_to_file(
@@ -184,9 +184,10 @@ def main():
         and landcover_reclassification_rules
         and ":" in landcover_reclassification_rules
     ):
-        msg = "Using provided string of rules to reclassify the '{map}' map"
-        msg = msg.format(map=landcover)
-        grass.verbose(_(msg))
+        verbose_message(
+            "Using provided string of rules to reclassify the '{map}' map",
+            map=landcover,
+        )
         temporary_maes_land_classes = temporary_filename(filename=maes_land_classes)
         landcover_reclassification_rules = string_to_file(
             landcover_reclassification_rules, filename=maes_land_classes
@@ -241,8 +242,9 @@ def main():
 
     population = options["population"]
     if population:
-        population_ns_resolution = grass.raster_info(population)["nsres"]
-        population_ew_resolution = grass.raster_info(population)["ewres"]
+        population_info = grass.raster_info(population)
+        population_ns_resolution = population_info["nsres"]
+        population_ew_resolution = population_info["ewres"]
 
     """Outputs"""
 
@@ -285,13 +287,13 @@ def main():
 
     """ First, care about the computational region"""
 
+    grass.use_temp_region()  # to safely modify the region
+
     if mask:
-        msg = "Masking NULL cells based on '{mask}'".format(mask=mask)
-        grass.verbose(_(msg))
+        verbose_message("Masking NULL cells based on '{mask}'", mask=mask)
         r.mask(raster=mask, overwrite=True, quiet=True)
 
     if landuse_extent:
-        grass.use_temp_region()  # to safely modify the region
         g.region(flags="p", raster=landuse)  # Set region to 'mask'
         msg = "|! Computational resolution matched to {raster}"
         msg = msg.format(raster=landuse)
@@ -301,6 +303,7 @@ def main():
             or Suitability of Land to Support Recreation Activities (SLSRA)"""
 
     land_component = []  # a list, use .extend() wherever required
+    suitability_expression = None
 
     if land:
 
@@ -310,21 +313,30 @@ def main():
 
         msg = "Deriving land suitability from '{landuse}' "
         msg += "based on rules described in file '{rules}'"
-        grass.verbose(msg.format(landuse=landuse, rules=suitability_scores))
+        verbose_message(msg, landuse=landuse, rules=suitability_scores)
 
-        # suitability is the 'suitability_map_name'
-        recode_map(
-            raster=landuse,
-            rules=suitability_scores,
-            colors=SCORE_COLORS,
-            output=suitability_map_name,
-        )
+        # score land use within the sum of the recreation potential, rather
+        # than via r.recode into a map of its own, if the rules allow it
+        with open(suitability_scores) as rules_file:
+            suitability_expression = recode_expression(
+                raster=landuse, rules=rules_file.read(), default=0
+            )
 
-        append_map_to_component(
-            raster=suitability_map_name,
-            component_name="land",
-            component_list=land_component,
-        )
+        if not suitability_expression:
+
+            # suitability is the 'suitability_map_name'
+            recode_map(
+                raster=landuse,
+                rules=suitability_scores,
+                colors=SCORE_COLORS,
+                output=suitability_map_name,
+            )
+
+            append_map_to_component(
+                raster=suitability_map_name,
+                component_name="land",
+                component_list=land_component,
+            )
 
     """Water Component"""
 
@@ -334,10 +346,10 @@ def main():
     if water:
 
         water_component = water.split(",")
-        msg = "Water component includes currently: {component}"
-        msg = msg.format(component=water_component)
-        grass.debug(_(msg))
-        # grass.verbose(_(msg))
+        debug_message(
+            "Water component includes currently: {component}",
+            component=water_component,
+        )
 
     if lakes:
 
@@ -438,8 +450,11 @@ def main():
         natural_component = natural.split(",")
 
     if protected:
-        msg = "Scoring protected areas '{protected}' based on '{rules}'"
-        grass.verbose(_(msg.format(protected=protected, rules=protected_scores)))
+        verbose_message(
+            "Scoring protected areas '{protected}' based on '{rules}'",
+            protected=protected,
+            rules=protected_scores,
+        )
 
         protected_areas = protected_areas_map_name
 
@@ -464,50 +479,70 @@ def main():
 
     recreation_potential_component = []
 
-    if land_component:
-
-        for dummy_index in land_component:
-
-            # remove 'land_map' from 'land_component'
-            # process and add it back afterwards
-            land_map = land_component.pop(0)
-
-            """
-            This section sets NULL cells to 0.
-            Because `r.null` operates on the complete input raster map,
-            manually subsetting the input map is required.
-            """
-            suitability_map = temporary_filename(filename=land_map)
-            subset_land = EQUATION.format(result=suitability_map, expression=land_map)
-            r.mapcalc(subset_land)
+    if land_component or suitability_expression:
+
+        """
+        This section sets NULL cells to 0.
+        Because `r.null` operates on the complete input raster map, and
+        rewrites it, NULL cells are set to 0 within an r.mapcalc expression.
+        """
+        debug_message("Setting NULL cells to 0")  # REMOVEME ?
+        subset_land_expressions = [
+            "if(isnull({raster}), 0, {raster})".format(raster=land_map)
+            for land_map in land_component
+        ]
+
+        # land use not covered by the scoring rules scores 0, as would its
+        # NULL score after r.recode
+        if suitability_expression:
+            subset_land_expressions.append(suitability_expression)
+
+        # Sum the expressions straight into the recreation potential, unless
+        # the maps are to be smoothed or make up the potential on their own
+        if average_filter or not (
+            len(subset_land_expressions) > 1 or water_component or natural_component
+        ):
+            # name only the maps actually written
+            suitability_maps = [
+                temporary_filename(filename=land_map) for land_map in land_component
+            ]
+            if suitability_expression:
+                suitability_maps.append(suitability_map_name)
+
+            subset_land_equations = [
+                EQUATION.format(result=suitability_map, expression=expression)
+                for suitability_map, expression in zip(
+                    suitability_maps, subset_land_expressions
+                )
+            ]
+            # r.mapcalc computes all suitability maps in one and the same run
+            grass.mapcalc("\n".join(subset_land_equations), overwrite=True)
+            remove_map_at_exit(suitability_maps)
+            land_component = suitability_maps
 
-            grass.debug(_("Setting NULL cells to 0"))  # REMOVEME ?
-            r.null(map=suitability_map, null=0)  # Set NULLs to 0
+        else:
+            land_component = subset_land_expressions
 
-            msg = "\nAdding land suitability map '{suitability}' "
-            msg += "to 'Recreation Potential' component\n"
-            msg = msg.format(suitability=suitability_map)
-            grass.verbose(_(msg))
+        msg = "\nAdding land suitability '{suitability}' "
+        msg += "to 'Recreation Potential' component\n"
+        verbose_message(msg, suitability=",".join(land_component))
 
-            # add 'suitability_map' to 'land_component'
-            land_component.append(suitability_map)
-
-    if len(land_component) > 1:
-        grass.verbose(_("\nNormalize 'Land' component\n"))
-        zerofy_and_normalise_component(
-            land_component, THRESHHOLD_ZERO, land_component_map_name
-        )
-        recreation_potential_component.extend(land_component)
-    else:
-        recreation_potential_component.extend(land_component)
+    recreation_potential_component.extend(land_component)
 
     if land_component and average_filter:
         smooth_component(land_component, method="average", size=7)
 
-    remove_map_at_exit(land_component)
+    # Normalise the water and natural components inside the expression of the
+    # recreation potential, if summed with other components, rather than
+    # writing each into a map of its own first
+
+    inline_components = {}
 
-    if len(water_component) > 1:
-        grass.verbose(_("\nNormalize 'Water' component\n"))
+    if len(water_component) > 1 and (land_component or natural_component):
+        verbose_message("\nNormalize 'Water' component\n")
+        inline_components["water_component"] = water_component
+    elif len(water_component) > 1:
+        verbose_message("\nNormalize 'Water' component\n")
         zerofy_and_normalise_component(
             water_component, THRESHHOLD_ZERO, water_component_map_name
         )
@@ -517,8 +552,11 @@ def main():
 
     remove_map_at_exit(water_component_map_name)
 
-    if len(natural_component) > 1:
-        grass.verbose(_("\nNormalize 'Natural' component\n"))
+    if len(natural_component) > 1 and (land_component or water_component):
+        verbose_message("\nNormalize 'Natural' component\n")
+        inline_components["natural_component"] = natural_component
+    elif len(natural_component) > 1:
+        verbose_message("\nNormalize 'Natural' component\n")
         zerofy_and_normalise_component(
             components=natural_component,
             threshhold=THRESHHOLD_ZERO,
@@ -528,6 +566,12 @@ def main():
     else:
         recreation_potential_component.extend(natural_component)
 
+    # the sums of the inlined components are computed concurrently
+    if inline_components:
+        recreation_potential_component.extend(
+            normalise_components_expressions(inline_components, THRESHHOLD_ZERO)
+        )
+
     if natural_component and average_filter:
         smooth_component(natural_component, method="average", size=7)
 
@@ -537,9 +581,11 @@ def main():
 
     tmp_recreation_potential = temporary_filename(filename=recreation_potential_map_name)
 
-    msg = "Computing intermediate 'Recreation Potential' map: '{potential}'"
-    grass.verbose(_(msg.format(potential=tmp_recreation_potential)))
-    grass.debug(_("Maps: {maps}".format(maps=recreation_potential_component)))
+    verbose_message(
+        "Computing intermediate 'Recreation Potential' map: '{potential}'",
+        potential=tmp_recreation_potential,
+    )
+    debug_message("Maps: {maps}", maps=recreation_potential_component)
 
     zerofy_and_normalise_component(
         components=recreation_potential_component,
@@ -547,29 +593,37 @@ def main():
         output_name=tmp_recreation_potential,
     )
 
-    # recode recreation_potential
-    tmp_recreation_potential_categories = temporary_filename(filename=recreation_potential)
+    # recode recreation_potential, straight into the requested output map,
+    # else classify it within the expression of the spectrum. Both classify
+    # alike, so the spectrum does not depend on the outputs requested
+    if recreation_potential:
+        tmp_recreation_potential_categories = recreation_potential
+
+        verbose_message(
+            "\nClassifying '{potential}' map", potential=tmp_recreation_potential
+        )
 
-    msg = "\nClassifying '{potential}' map"
-    msg = msg.format(potential=tmp_recreation_potential)
-    grass.verbose(_(msg))
+        classify_recreation_component(
+            component=tmp_recreation_potential,
+            rules=RECREATION_POTENTIAL_CATEGORIES,
+            output_name=tmp_recreation_potential_categories,
+        )
 
-    classify_recreation_component(
-        component=tmp_recreation_potential,
-        rules=RECREATION_POTENTIAL_CATEGORIES,
-        output_name=tmp_recreation_potential_categories,
-    )
+    else:
+        tmp_recreation_potential_categories = recode_expression(
+            raster=tmp_recreation_potential,
+            rules=RECREATION_POTENTIAL_CATEGORIES,
+            nulls_to_zero=False,
+        )
 
     if recreation_potential:
 
-        # export 'recreation_potential' map and
-        # use 'output_name' for the temporary 'potential' map for spectrum
-        tmp_recreation_potential_categories = export_map(
-            input_name=tmp_recreation_potential_categories,
+        # export 'recreation_potential' map, also used for the spectrum
+        export_map(
+            input_name=recreation_potential,
             title=potential_title,
             categories=POTENTIAL_CATEGORY_LABELS,
             colors=POTENTIAL_COLORS,
-            output_name=recreation_potential,
             timestamp=timestamp,
         )
 
@@ -597,18 +651,19 @@ def main():
 
         if artificial and roads:
 
-            msg = "Roads distance categories: {c}"
-            msg = msg.format(c=roads_distance_categories)
-            grass.debug(_(msg))
+            debug_message(
+                "Roads distance categories: {c}", c=roads_distance_categories
+            )
             roads_proximity = compute_artificial_proximity(
                 raster=roads,
                 distance_categories=roads_distance_categories,
                 output_name=roads_proximity_map_name,
             )
 
-            msg = "Artificial distance categories: {c}"
-            msg = msg.format(c=artificial_distance_categories)
-            grass.debug(_(msg))
+            debug_message(
+                "Artificial distance categories: {c}",
+                c=artificial_distance_categories,
+            )
             artificial_proximity = compute_artificial_proximity(
                 raster=artificial,
                 distance_categories=artificial_distance_categories,
@@ -662,11 +717,13 @@ def main():
 
         # REVIEW --------------------------------------------------------------
         tmp_recreation_opportunity = temporary_filename(filename=recreation_opportunity_map_name)
-        msg = "Computing intermediate opportunity map '{opportunity}'"
-        grass.debug(_(msg.format(opportunity=tmp_recreation_opportunity)))
+        debug_message(
+            "Computing intermediate opportunity map '{opportunity}'",
+            opportunity=tmp_recreation_opportunity,
+        )
 
-        grass.verbose(_("\nNormalize 'Recreation Opportunity' component\n"))
-        grass.debug(_("Maps: {maps}".format(maps=recreation_opportunity_component)))
+        verbose_message("\nNormalize 'Recreation Opportunity' component\n")
+        debug_message("Maps: {maps}", maps=recreation_opportunity_component)
 
         zerofy_and_normalise_component(
             components=recreation_opportunity_component,
@@ -677,29 +734,40 @@ def main():
         # Why threshhold 0.0003? How and why it differs from 0.0001?
         # -------------------------------------------------------------- REVIEW
 
-        msg = "Classifying '{opportunity}' map"
-        grass.verbose(msg.format(opportunity=tmp_recreation_opportunity))
+        # recode opportunity_component, straight into the requested output
+        # map, else classify it within the expression of the spectrum. Both
+        # classify alike, as for the potential
+        if recreation_opportunity:
+            tmp_recreation_opportunity_categories = recreation_opportunity
 
-        # recode opportunity_component
-        tmp_recreation_opportunity_categories = temporary_filename(filename=recreation_opportunity)
-        classify_recreation_component(
-            component=tmp_recreation_opportunity,
-            rules=RECREATION_OPPORTUNITY_CATEGORIES,
-            output_name=tmp_recreation_opportunity_categories,
-        )
+            verbose_message(
+                "Classifying '{opportunity}' map",
+                opportunity=tmp_recreation_opportunity,
+            )
+
+            classify_recreation_component(
+                component=tmp_recreation_opportunity,
+                rules=RECREATION_OPPORTUNITY_CATEGORIES,
+                output_name=tmp_recreation_opportunity_categories,
+            )
+
+        else:
+            tmp_recreation_opportunity_categories = recode_expression(
+                raster=tmp_recreation_opportunity,
+                rules=RECREATION_OPPORTUNITY_CATEGORIES,
+                nulls_to_zero=False,
+            )
 
         """ Recreation Opportunity [Output]"""
 
         if recreation_opportunity:
 
-            # export 'recreation_opportunity' map and
-            # use 'output_name' for the temporary 'potential' map for spectrum
-            tmp_recreation_opportunity_categories = export_map(
-                input_name=tmp_recreation_opportunity_categories,
+            # export 'recreation_opportunity' map, also used for the spectrum
+            export_map(
+                input_name=recreation_opportunity,
                 title=opportunity_title,
                 categories=OPPORTUNITY_CATEGORY_LABELS,
                 colors=OPPORTUNITY_COLORS,
-                output_name=recreation_opportunity,
                 timestamp=timestamp,
             )
 
@@ -715,10 +783,9 @@ def main():
             spectrum=recreation_spectrum,
         )
 
-        msg = "Writing '{spectrum}' map"
-        msg = msg.format(spectrum=recreation_spectrum)
-        grass.verbose(_(msg))
-        get_univariate_statistics(recreation_spectrum)
+        verbose_message("Writing '{spectrum}' map", spectrum=recreation_spectrum)
+        if grass.verbosity() > 2:
+            get_univariate_statistics(recreation_spectrum)
 
         # get category labels
         temporary_spectrum_categories = temporary_filename(filename="categories_of_" + recreation_spectrum)
@@ -754,17 +821,24 @@ def main():
 
         """Highest Recreation Spectrum == 9"""
 
-        expression = (
-            "if({spectrum} == {highest_recreation_category}, {spectrum}, null())"
-        )
-        highest_spectrum_expression = expression.format(
-            spectrum=recreation_spectrum,
-            highest_recreation_category=HIGHEST_RECREATION_CATEGORY,
+        # a reclassed map is a virtual one, no raster data are written. Keep
+        # it temporary: registered after the spectrum map, it is removed
+        # before its base map and never left behind depending on it
+        highest_spectrum = temporary_filename(filename=highest_spectrum)
+        remove_map_at_exit(highest_spectrum)
+
+        highest_spectrum_rules = "{category} = {category}\n* = NULL"
+        highest_spectrum_rules = highest_spectrum_rules.format(
+            category=HIGHEST_RECREATION_CATEGORY
         )
-        highest_spectrum_equation = EQUATION.format(
-            result=highest_spectrum, expression=highest_spectrum_expression
+        r.reclass(
+            input=recreation_spectrum,
+            rules="-",
+            stdin=highest_spectrum_rules,
+            output=highest_spectrum,
+            overwrite=True,
+            quiet=True,
         )
-        r.mapcalc(highest_spectrum_equation, overwrite=True)
 
         """Distance map"""
 
@@ -788,6 +862,7 @@ def main():
             rules=spectrum_distance_categories,
             colors=SCORE_COLORS,
             output=distance_categories_to_highest_spectrum,
+            nulls_to_zero=False,  # distances cover every cell
         )
 
         temporary_distance_categories_to_highest_spectrum = temporary_filename(filename=distance_categories_to_highest_spectrum)
@@ -813,18 +888,20 @@ def main():
             quiet=True,
         )
 
-        grass.use_temp_region()  # to safely modify the region
         g.region(
             nsres=population_ns_resolution, ewres=population_ew_resolution, flags="a"
         )  # Resolution should match 'population' FIXME
-        msg = "|! Computational extent & resolution matched to {raster}"
-        msg = msg.format(raster=landuse)
-        grass.verbose(_(msg))
+        verbose_message(
+            "|! Computational extent & resolution matched to {raster}",
+            raster=landuse,
+        )
 
-        population_statistics = get_univariate_statistics(population)
-        population_total = population_statistics['sum']
-        msg = "|i Population statistics: {s}".format(s=population_total)
-        grass.verbose(_(msg))
+        # The total population is only reported: skip scanning the
+        # population map unless verbose messages are shown
+        if grass.verbosity() > 2:
+            population_statistics = get_univariate_statistics(population)
+            population_total = population_statistics["sum"]
+            verbose_message("|i Population statistics: {s}", s=population_total)
 
         """Demand Distribution"""
 
@@ -847,7 +924,7 @@ def main():
         copy_expression = "{input_raster}"
         copy_expression = copy_expression.format(input_raster=demand)
         copy_equation = EQUATION.format(result=demand_copy, expression=copy_expression)
-        r.mapcalc(copy_equation, overwrite=True)
+        grass.mapcalc(copy_equation, overwrite=True)
 
         # remove the reclassed map 'demand'
         g.remove(flags="f", type="raster", name=demand, quiet=True)
@@ -880,14 +957,12 @@ def main():
             # Maybe it can, though, after successfully testing its
             # integration to build_distance_function().
 
-            grass.debug(
-                _("Unmet demand function: {f}".format(f=unmet_demand_expression))
-            )
+            debug_message("Unmet demand function: {f}", f=unmet_demand_expression)
 
             unmet_demand_equation = EQUATION.format(
                 result=unmet_demand, expression=unmet_demand_expression
             )
-            r.mapcalc(unmet_demand_equation, overwrite=True)
+            grass.mapcalc(unmet_demand_equation, overwrite=True)
 
             if base_vector:
                 update_vector(
@@ -917,15 +992,14 @@ def main():
             # Maybe it can, though, after successfully testing its
             # integration to build_distance_function().
 
-            msg = "Mobility function: {f}"
-            grass.debug(_(msg.format(f=mobility_expression)))
+            debug_message("Mobility function: {f}", f=mobility_expression)
 
             """Flow map"""
 
             mobility_equation = EQUATION.format(
                 result=flow, expression=mobility_expression
             )
-            r.mapcalc(mobility_equation, overwrite=True)
+            grass.mapcalc(mobility_equation, overwrite=True)
 
             if base_vector:
                 update_vector(
@@ -967,10 +1041,8 @@ def main():
         )
 
     # restore region
-    if landuse_extent:
-        grass.del_temp_region()  # restoring previous region settings
-        grass.verbose("Original Region restored")
+    grass.del_temp_region()  # restoring previous region settings
+    verbose_message("Original Region restored")
 
     # print citation
-    citation = "Citation: " + CITATION_RECREATION_POTENTIAL
-    grass.verbose(citation)
+    verbose_message("Citation: {citation}", citation=CITATION_RECREATION_POTENTIAL)
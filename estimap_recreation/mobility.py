@@ -93,65 +93,54 @@ def mobility_function(
     --------
     ...
     """
-    expressions = {}  # create a dictionary of expressions
+    # Select the coefficients of each distance category per cell, so as to
+    # evaluate a single exponential per cell instead of one per category.
+    # Note, the last distance category is not considered.
+    distance_categories = sorted(coefficients)[:-1]
+
+    kappa_expression = "null()"
+    alpha_expression = "null()"
+    for distance_category in reversed(distance_categories):
+        kappa, alpha = coefficients[distance_category]
+        category_condition = "{distance} == {category}".format(
+            distance=distance, category=distance_category
+        )
 
-    for distance_category, parameters in coefficients.items():
-        kappa, alpha = parameters
+        kappa_expression = "if( {condition}, {kappa}, {otherwise} )".format(
+            condition=category_condition, kappa=kappa, otherwise=kappa_expression
+        )
 
         # Note, alpha gets a minus, that is: -alpha
-        expressions[distance_category] = build_distance_function(
-            constant=constant,
-            kappa=kappa,
-            alpha=-alpha,
-            variable=population,
-            score=score,
+        alpha_expression = "if( {condition}, {alpha}, {otherwise} )".format(
+            condition=category_condition, alpha=-alpha, otherwise=alpha_expression
         )
-        # suitability=suitability)  # Not used.
-        # Maybe it can, though, after successfully testing its
-        # integration to build_distance_function().
 
-        grass.debug(_("For distance '{d}':".format(d=distance)))
-        grass.debug(_(expressions[distance_category]))
+    grass.debug(_("Kappa per distance category: {e}".format(e=kappa_expression)))
+    grass.debug(_("Alpha per distance category: {e}".format(e=alpha_expression)))
 
-    msg = "Expressions per distance category: {e}".format(e=expressions)
-    grass.debug(_(msg))
+    mobility_function_expression = build_distance_function(
+        constant=constant,
+        kappa="kappa",
+        alpha="alpha",
+        variable=population,
+        score=score,
+    )
+    # suitability=suitability)  # Not used.
+    # Maybe it can, though, after successfully testing its
+    # integration to build_distance_function().
 
     # build expressions -- explicit: use the'score' kwarg!
-    expression = (
-        "eval( mobility_0 = {expression_0},"
-        " \ \n mobility_1 = {expression_1},"
-        " \ \n mobility_2 = {expression_2},"
-        " \ \n mobility_3 = {expression_3},"
-        " \ \n distance_0 = {distance} == {distance_category_0},"
-        " \ \n distance_1 = {distance} == {distance_category_1},"
-        " \ \n distance_2 = {distance} == {distance_category_2},"
-        " \ \n distance_3 = {distance} == {distance_category_3},"
-        " \ \n if( distance_0, mobility_0,"
-        " \ \n if( distance_1, mobility_1,"
-        " \ \n if( distance_2, mobility_2,"
-        " \ \n if( distance_3, mobility_3,"
-        " \ \n null() )))))"
-    )
+    expression = "eval( kappa = {kappa}, alpha = {alpha}, {function} )"
     grass.debug(_("Mapcalc expression: {e}".format(e=expression)))
 
     # replace keywords appropriately
-    # 'distance' is a map
-    # 'distance_category' is a value
-    # hence: 'distance' != 'distance_category'
     mobility_expression = expression.format(
-        expression_0=expressions[0],
-        expression_1=expressions[1],
-        expression_2=expressions[2],
-        expression_3=expressions[3],
-        distance_category_0=0,
-        distance_category_1=1,
-        distance_category_2=2,
-        distance_category_3=3,
-        distance=distance,
+        kappa=kappa_expression,
+        alpha=alpha_expression,
+        function=mobility_function_expression,
     )
-    # FIXME Make the above more elegant?
 
-    msg = "Big expression (after formatting): {e}".format(e=expression)
+    msg = "Big expression (after formatting): {e}".format(e=mobility_expression)
     grass.debug(_(msg))
 
     return mobility_expression
@@ -227,12 +216,7 @@ def compute_unmet_demand(
     grass.debug(_(msg))
 
     # build expressions -- explicit: use the 'score' kwarg!
-    expression = (
-        "eval( unmet_demand = {expression},"
-        " \ \n distance = {distance} == {distance_category},"
-        " \ \n if( distance, unmet_demand,"
-        " \ \n null() ))"
-    )
+    expression = "if( {distance} == {distance_category}, {expression}, null() )"
     grass.debug(_("Mapcalc expression: {e}".format(e=expression)))
 
     # replace keywords appropriately
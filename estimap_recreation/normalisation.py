@@ -19,98 +19,256 @@ from estimap_recreation.constants import *
 from estimap_recreation.grassy_utilities import *
 
 
-def zerofy_small_values(raster, threshhold, output_name):
+ZEROFY_EXPRESSION = "float(if({raster} < {threshhold}, 0, {raster}))"
+
+
+def get_normalisation_range(raster):
     """
-    Set the input raster map cell values to 0 if they are smaller than the
-    given threshhold
+    Return the minimum and maximum of a raster map to normalise. Fail if the
+    raster map does not exist or holds no values.
 
     Parameters
     ----------
     raster :
         Name of input raster map
 
+    Returns
+    -------
+    minimum, maximum :
+        Minimum and maximum cell value of the input raster map
+
+    Examples
+    --------
+    ...
+    """
+    # r.info fails for a missing map: no need to look for it first
+    try:
+        minimum, maximum = get_raster_range(raster)
+    except CalledModuleError:
+        grass.fatal("Raster map {name} not found".format(name=raster))
+
+    # univar_string = grass.read_command('r.univar', flags='g', map=raster)
+    # univar_string = univar_string.replace('\n', '| ').replace('\r', '| ')
+    # msg = "Univariate statistics: {us}".format(us=univar_string)
+
+    debug_message("Minimum: {m}", level=2, m=minimum)
+    debug_message("Maximum: {m}", level=2, m=maximum)
+
+    if minimum is None or maximum is None:
+        msg = "Minimum and maximum values of the <{raster}> map are 'None'. "
+        msg += "The {raster} map may be empty "
+        msg += "OR the MASK opacifies all non-NULL cells."
+        grass.fatal(_(msg.format(raster=raster)))
+
+    return minimum, maximum
+
+
+def normalisation_expression(expression, minimum, maximum):
+    """
+    Build an r.mapcalc expression that normalizes the cells of the input
+    expression, whose minimum and maximum are known, by subtracting the
+    minimum and dividing by the range.
+
+    Parameters
+    ----------
+    expression :
+        Name of input raster map or r.mapcalc expression
+
+    minimum :
+        Minimum value of the input expression
+
+    maximum :
+        Maximum value of the input expression
+
+    Returns
+    -------
+    normalisation :
+        An r.mapcalc expression of FCELL type
+
+    Examples
+    --------
+    >>> normalisation_expression("potential", 2, 6)
+    'float((potential - 2) * 0.25)'
+    """
+    if maximum == minimum:
+        # as in r.mapcalc, division by a zero range yields NULL
+        return "float(null())"
+
+    # scale by the precomputed reciprocal of the range: one subtraction
+    # and one multiplication per cell instead of a per-cell division
+    normalisation = "float(({expression} - {minimum}) * {scale})"
+    return normalisation.format(
+        expression=expression, minimum=minimum, scale=1.0 / (maximum - minimum)
+    )
+
+
+def component_sum_equation(components, threshhold, output_name):
+    """
+    Build an r.mapcalc equation for the sum of the given components, stored
+    as FCELL, with values smaller than the threshhold set to zero in the same
+    pass.
+
+    Parameters
+    ----------
+    components :
+        Input list of raster maps or r.mapcalc expressions (components)
+
     threshhold :
-        Reference for which to flatten smaller raster pixel values to zero
+        Reference value for which to flatten all smaller raster pixel values to
+        zero
 
     output_name :
         Name of output raster map
 
     Returns
     -------
-        Does not return any value
+    component_equation :
+        An r.mapcalc equation
 
     Examples
     --------
     ...
     """
-    rounding = "if({raster} < {threshhold}, 0, {raster})"
-    rounding = rounding.format(raster=raster, threshhold=threshhold)
-    rounding_equation = EQUATION.format(result=output_name, expression=rounding)
-    grass.mapcalc(rounding_equation, overwrite=True)
+    # build mapcalc expression, store the sum as FCELL
+    component_expression = "float({sum})".format(sum=SPACY_PLUS.join(components))
+
+    if threshhold > THRESHHOLD_ZERO:
+        # set small values to zero in the same pass as the sum
+        msg = "Setting values < {threshhold} in the sum of components to zero"
+        verbose_message(msg, threshhold=threshhold)
+        component_expression = (
+            "eval( component_sum = {sum},"
+            " if(component_sum < {threshhold}, 0, component_sum) )"
+        ).format(sum=component_expression, threshhold=threshhold)
+
+    return EQUATION.format(result=output_name, expression=component_expression)
 
 
-def normalize_map(raster, output_name):
+def normalise_component_expression(components, threshhold, name):
     """
-    Normalize all raster map cells by subtracting the raster map's minimum and
-    dividing by the range.
+    Sums up all maps listed in the given "components" object and returns an
+    r.mapcalc expression of the normalised sum. The sum of more than one
+    component is written to a temporary raster map, so as to learn its range.
 
     Parameters
     ----------
-    raster :
-        Name of input raster map
+    components :
+        Input list of raster maps or r.mapcalc expressions (components)
 
-    output_name :
-        Name of output raster map
+    threshhold :
+        Reference value for which to flatten all smaller raster pixel values to
+        zero
+
+    name :
+        Name to derive the temporary raster map's name from
 
     Returns
     -------
+    normalisation :
+        An r.mapcalc expression of the normalised component
 
     Examples
     --------
     ...
     """
-    # grass.debug(_("Input to normalize: {name}".format(name=raster)))
-    # grass.debug(_("Ouput: {name}".format(name=output_name)))
+    if len(components) > 1:
 
-    finding = grass.find_file(name=raster, element="cell")
+        # temporary map name
+        tmp_output = temporary_filename(filename=name + ".sum")
 
-    if not finding["file"]:
-        grass.fatal("Raster map {name} not found".format(name=raster))
-    # else:
-    #     grass.debug("Raster map {name} found".format(name=raster))
+        component_equation = component_sum_equation(
+            components, threshhold, tmp_output
+        )
+        grass.mapcalc(component_equation, overwrite=True)
 
-    # univar_string = grass.read_command('r.univar', flags='g', map=raster)
-    # univar_string = univar_string.replace('\n', '| ').replace('\r', '| ')
-    # msg = "Univariate statistics: {us}".format(us=univar_string)
+        minimum, maximum = get_normalisation_range(tmp_output)
+        return normalisation_expression(tmp_output, minimum, maximum)
 
-    minimum = grass.raster_info(raster)["min"]
-    grass.debug(_("Minimum: {m}".format(m=minimum)))
+    # a single component is normalised directly, there is nothing to sum
+    component = components[0]
 
-    maximum = grass.raster_info(raster)["max"]
-    grass.debug(_("Maximum: {m}".format(m=maximum)))
+    if threshhold > THRESHHOLD_ZERO:
+        msg = "Setting values < {threshhold} in '{raster}' to zero"
+        verbose_message(msg, threshhold=threshhold, raster=component)
+
+        # The range of the thresholded map follows from the one of the
+        # input: set small values to zero inside the normalisation
+        # expression rather than in a temporary map
+        if component in TEMPORARY_FILENAMES:
+            # a map written by this run holds values only within the current
+            # region and MASK: its stored range is the one r.univar computes
+            minimum, maximum = get_normalisation_range(component)
+
+        else:
+            univariate = grass.parse_command("r.univar", flags="g", map=component)
+            if "min" not in univariate:
+                msg = "The {raster} map may be empty "
+                msg += "OR the MASK opacifies all non-NULL cells."
+                grass.fatal(_(msg.format(raster=component)))
+
+            minimum = float(univariate["min"])
+            maximum = float(univariate["max"])
+
+        minimum = 0 if minimum < threshhold else minimum
+        maximum = maximum if maximum >= threshhold else 0
+
+        zerofy_expression = ZEROFY_EXPRESSION.format(
+            raster=component, threshhold=threshhold
+        )
+        return normalisation_expression(zerofy_expression, minimum, maximum)
 
-    if minimum is None or maximum is None:
-        msg = "Minimum and maximum values of the <{raster}> map are 'None'. "
-        msg += "The {raster} map may be empty "
-        msg += "OR the MASK opacifies all non-NULL cells."
-        grass.fatal(_(msg.format(raster=raster)))
+    minimum, maximum = get_normalisation_range(component)
+    return normalisation_expression(component, minimum, maximum)
 
-    normalisation = "float(({raster} - {minimum}) / ({maximum} - {minimum}))"
-    normalisation = normalisation.format(
-        raster=raster, minimum=minimum, maximum=maximum
-    )
 
-    # Maybe this can go in the parent function? 'raster' names are too long!
-    # msg = "Normalization expression: "
-    # msg += normalisation
-    # grass.verbose(_(msg))
+def normalise_components_expressions(components, threshhold):
+    """
+    Sums up each list of more than one map in the given "components"
+    dictionary and returns r.mapcalc expressions of the normalised sums. The
+    sums are written to temporary raster maps by concurrent r.mapcalc
+    processes.
 
-    normalisation_equation = EQUATION.format(
-        result=output_name, expression=normalisation
-    )
-    grass.mapcalc(normalisation_equation, overwrite=True)
+    Parameters
+    ----------
+    components :
+        Dictionary of names to input lists of more than one raster map or
+        r.mapcalc expression (components)
 
-    get_univariate_statistics(output_name)
+    threshhold :
+        Reference value for which to flatten all smaller raster pixel values to
+        zero
+
+    Returns
+    -------
+    normalisations :
+        A list of r.mapcalc expressions of the normalised components, in the
+        order of their sorted names
+
+    Examples
+    --------
+    ...
+    """
+    names = sorted(components)
+    tmp_outputs = [temporary_filename(filename=name + ".sum") for name in names]
+
+    processes = [
+        grass.mapcalc_start(
+            component_sum_equation(components[name], threshhold, tmp_output),
+            overwrite=True,
+        )
+        for name, tmp_output in zip(names, tmp_outputs)
+    ]
+    # wait for every sum before failing, so none still writes at cleanup
+    failed = [name for name, process in zip(names, processes) if process.wait() != 0]
+    if failed:
+        msg = "Failed to sum the {names} maps".format(names=", ".join(failed))
+        grass.fatal(_(msg))
+
+    normalisations = []
+    for tmp_output in tmp_outputs:
+        minimum, maximum = get_normalisation_range(tmp_output)
+        normalisations.append(normalisation_expression(tmp_output, minimum, maximum))
+    return normalisations
 
 
 def zerofy_and_normalise_component(components, threshhold, output_name):
@@ -126,7 +284,7 @@ def zerofy_and_normalise_component(components, threshhold, output_name):
     Parameters
     ----------
     components :
-        Input list of raster maps (components)
+        Input list of raster maps or r.mapcalc expressions (components)
 
     threshhold :
         Reference value for which to flatten all smaller raster pixel values to
@@ -143,50 +301,23 @@ def zerofy_and_normalise_component(components, threshhold, output_name):
     --------
     ...
     """
-    msg = "Normalising sum of: "
-    msg += ",".join(components)
-    grass.debug(_(msg))
-    grass.verbose(_(msg))
-
-    if len(components) > 1:
-
-        # prepare string for mapcalc expression
-        components = [name.split("@")[0] for name in components]
-        components_string = SPACY_PLUS.join(components)
-        components_string = components_string.replace(" ", "")
-        components_string = components_string.replace("+", "_")
+    if not components:
+        debug_message("No components to normalise")
+        return
 
-        # temporary map names
-        tmp_intermediate = temporary_filename(filename=components_string)
-        tmp_output = temporary_filename(filename=components_string)
+    verbose_message("Normalising sum of: {maps}", maps=",".join(components))
 
-        # build mapcalc expression
-        component_expression = SPACY_PLUS.join(components)
-        component_equation = EQUATION.format(
-            result=tmp_intermediate, expression=component_expression
-        )
-
-        grass.mapcalc(component_equation, overwrite=True)
-
-    elif len(components) == 1:
-        # temporary map names, if components contains one element
-        tmp_intermediate = components[0]
-        tmp_output = temporary_filename(filename=tmp_intermediate)
-
-    if threshhold > THRESHHOLD_ZERO:
-        msg = "Setting values < {threshhold} in '{raster}' to zero"
-        grass.verbose(msg.format(threshhold=threshhold, raster=tmp_intermediate))
-        zerofy_small_values(tmp_intermediate, threshhold, tmp_output)
-
-    else:
-        tmp_output = tmp_intermediate
-
-    # grass.verbose(_("Temporary map name: {name}".format(name=tmp_output)))
-    grass.debug(_("Output map name: {name}".format(name=output_name)))
-    # r.info(map=tmp_output, flags='gre')
+    normalisation = normalise_component_expression(
+        components, threshhold, name=output_name
+    )
 
-    ### FIXME
+    debug_message("Output map name: {name}", name=output_name)
 
-    normalize_map(tmp_output, output_name)
+    normalisation_equation = EQUATION.format(
+        result=output_name, expression=normalisation
+    )
+    grass.mapcalc(normalisation_equation, overwrite=True)
 
-    ### FIXME
+    # scan the normalised map for its statistics only when reporting them
+    if grass.verbosity() > 2:
+        get_univariate_statistics(output_name)
@@ -55,18 +55,10 @@ def recreation_spectrum_expression(potential, opportunity):
     --------
     ...
     """
-    expression = (
-        "if( {potential} == 1 && {opportunity} == 1, 1,"
-        " \ \n if( {potential} == 1 && {opportunity} == 2, 2,"
-        " \ \n if( {potential} == 1 && {opportunity} == 3, 3,"
-        " \ \n if( {potential} == 2 && {opportunity} == 1, 4,"
-        " \ \n if( {potential} == 2 && {opportunity} == 2, 5,"
-        " \ \n if( {potential} == 2 && {opportunity} == 3, 6,"
-        " \ \n if( {potential} == 3 && {opportunity} == 1, 7,"
-        " \ \n if( {potential} == 3 && {opportunity} == 2, 8,"
-        " \ \n if( {potential} == 3 && {opportunity} == 3, 9)))))))))"
-    )
-
+    # potential and opportunity are categories 1, 2 or 3: the spectrum
+    # category follows arithmetically, without comparing to each pair.
+    # int() keeps the spectrum a CELL map, should r.recode write FCELL ones.
+    expression = "int(({potential} - 1) * 3 + {opportunity})"
     expression = expression.format(potential=potential, opportunity=opportunity)
 
     msg = "Recreation Spectrum expression: \n"
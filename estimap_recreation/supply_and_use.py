@@ -202,7 +202,7 @@ def compute_supply(
     copy_equation = EQUATION.format(
         result=reclassified_base, expression=reclassified_base
     )
-    r.mapcalc(copy_equation, overwrite=True)
+    grass.mapcalc(copy_equation, overwrite=True)
 
     # Count flow within each land cover category
     r.stats_zonal(
@@ -308,7 +308,7 @@ def compute_supply(
 
         # Discard areas out of MASK
         copy_equation = EQUATION.format(result=cells, expression=cells)
-        r.mapcalc(copy_equation, overwrite=True)
+        grass.mapcalc(copy_equation, overwrite=True)
 
         # Reassign cell category labels
         r.category(map=cells, rules="-", stdin=cells_rules, separator=":")
@@ -317,7 +317,7 @@ def compute_supply(
         extent_expression = "@{cells} * area()"
         extent_expression = extent_expression.format(cells=cells)
         extent_equation = EQUATION.format(result=extent, expression=extent_expression)
-        r.mapcalc(extent_equation, overwrite=True)
+        grass.mapcalc(extent_equation, overwrite=True)
 
         # Write extent figures as labels
         r.stats_zonal(
@@ -357,7 +357,7 @@ def compute_supply(
         weighted_equation = EQUATION.format(
             result=weighted, expression=weighted_expression
         )
-        r.mapcalc(weighted_equation, overwrite=True)
+        grass.mapcalc(weighted_equation, overwrite=True)
 
         # Write weighted extent figures as labels
         r.stats_zonal(
@@ -400,8 +400,8 @@ def compute_supply(
         # Compute weighted fractions of land types
         fraction_category_label = {
             key: float(value) / weighted_extents["sum"]
-            for (key, value) in weighted_extents.iteritems()
-            if key is not "sum"
+            for (key, value) in weighted_extents.items()
+            if key != "sum"
         }
 
         # Build fraction category and label rules for `r.category`
@@ -436,7 +436,7 @@ def compute_supply(
         flow_expression = "@{fractions} * @{flow}"
         flow_expression = flow_expression.format(fractions=fractions, flow=flow_in_base)
         flow_equation = EQUATION.format(result=flow, expression=flow_expression)
-        r.mapcalc(flow_equation, overwrite=True)
+        grass.mapcalc(flow_equation, overwrite=True)
 
         # Write flow figures as raster category labels
         r.stats_zonal(
@@ -469,7 +469,7 @@ def compute_supply(
         copy_equation = EQUATION.format(
             result=flow_in_category, expression=flow_in_category
         )
-        r.mapcalc(copy_equation, overwrite=True)
+        grass.mapcalc(copy_equation, overwrite=True)
 
         # Reassign cell category labels
         r.category(map=flow_in_category, rules="-", stdin=flow_rules, separator=":")
@@ -10,6 +10,7 @@ from __future__ import absolute_import
 from __future__ import print_function
 
 import csv
+import sys
 
 
 def merge_two_dictionaries(first, second):
@@ -20,6 +21,15 @@ def merge_two_dictionaries(first, second):
     return merged_dictionary
 
 
+def open_csv_file(filename):
+    """Open 'filename' for writing CSV rows: in binary mode under Python 2,
+    in text mode without newline translation under Python 3, as the csv
+    module expects in either case"""
+    if sys.version_info[0] < 3:
+        return open(filename, "wb")
+    return open(filename, "w", newline="")
+
+
 def dictionary_to_csv(filename, dictionary):
     """Write a Python dictionary as CSV named 'filename'
 
@@ -38,11 +48,7 @@ def dictionary_to_csv(filename, dictionary):
     Examples
     --------
     """
-    f = open(filename, "wb")
-    w = csv.writer(f)
-
-    # write a header
-    w.writerow(["category", "label", "value"])
+    rows = [("category", "label", "value")]  # header
 
     # terminology: from 'base' and 'cover' maps
     for base_key, value in dictionary.items():
@@ -50,9 +56,11 @@ def dictionary_to_csv(filename, dictionary):
         base_label = base_key[1]  # .decode('utf-8')
         if value is None or value == "":
             continue
-        w.writerow([base_category, base_label, value])
+        rows.append((base_category, base_label, value))
 
-    f.close()
+    # write all rows at once
+    with open_csv_file(filename) as csv_file:
+        csv.writer(csv_file).writerows(rows)
 
 
 def nested_dictionary_to_csv(filename, dictionary):
@@ -66,13 +74,9 @@ def nested_dictionary_to_csv(filename, dictionary):
     dictionary :
         Name of the input Python dictionary
     """
-    f = open(filename, "wb")
-    w = csv.writer(f)
-
-    # write a header
-    w.writerow(
-        ["base", "base_label", "cover", "cover_label", "area", "count", "percents"]
-    )
+    rows = [
+        ("base", "base_label", "cover", "cover_label", "area", "count", "percents")
+    ]  # header
 
     # terminology: from 'base' and 'cover' maps
     for base_key, inner_dictionary in dictionary.items():
@@ -86,8 +90,8 @@ def nested_dictionary_to_csv(filename, dictionary):
             area = inner_value[1]
             pixel_count = inner_value[2]
             pixel_percentage = inner_value[3]
-            w.writerow(
-                [
+            rows.append(
+                (
                     base_category,
                     base_label,
                     cover_category,
@@ -95,10 +99,12 @@ def nested_dictionary_to_csv(filename, dictionary):
                     area,
                     pixel_count,
                     pixel_percentage,
-                ]
+                )
             )
 
-    f.close()
+    # write all rows at once
+    with open_csv_file(filename) as csv_file:
+        csv.writer(csv_file).writerows(rows)
 
 
 # This function should be better off this module  # FIXME
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Name       Tests on recode_expression()
+Purpose    Test for no difference between raster maps scored via an r.mapcalc
+expression built by recode_expression() and via r.recode
+
+License    (C) 2018 by the GRASS Development Team
+           This program is free software under the GNU General Public License
+           (>=v2). Read the file COPYING that comes with GRASS for details.
+"""
+
+"""Libraries"""
+
+from grass.gunittest.case import TestCase
+
+from estimap_recreation.constants import RECREATION_POTENTIAL_CATEGORIES
+from estimap_recreation.constants import SUITABILITY_SCORES
+from estimap_recreation.grassy_utilities import recode_expression
+
+"""Globals"""
+
+PRECISION = 1e-6
+
+categories = "recode_expression_categories"  # CELL, 1 to 45
+values = "recode_expression_values"  # DCELL, 0 to 2.2 by 0.05
+values_with_nulls = "recode_expression_values_with_nulls"
+
+recoded = "recode_expression_recoded"
+nulls_to_zero = "recode_expression_nulls_to_zero"
+scored = "recode_expression_scored"
+nulls_differ = "recode_expression_nulls_differ"
+
+"""Test Case Class"""
+
+
+class TestRecodeExpression(TestCase):
+
+    to_remove = [
+        categories,
+        values,
+        values_with_nulls,
+        recoded,
+        nulls_to_zero,
+        scored,
+        nulls_differ,
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one row of CELL categories and DCELL values"""
+        cls.use_temp_region()
+        cls.runModule("g.region", n=1, s=0, e=45, w=0, rows=1, cols=45)
+        cls.runModule(
+            "r.mapcalc", expression="{m} = col()".format(m=categories), overwrite=True
+        )
+        cls.runModule(
+            "r.mapcalc",
+            expression="{m} = double(col() - 1) / 20".format(m=values),
+            overwrite=True,
+        )
+        cls.runModule(
+            "r.mapcalc",
+            expression="{m} = if(col() % 4 == 0, null(), {v})".format(
+                m=values_with_nulls, v=values
+            ),
+            overwrite=True,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove temporary region and test raster maps"""
+        cls.del_temp_region()
+        cls.runModule(
+            "g.remove", flags="f", type="raster", name=",".join(cls.to_remove)
+        )
+
+    def assertRecodedAlike(self, raster, rules, nulls_to_zero_first=False):
+        """Assert that recode_expression() scores the raster as r.recode does,
+        after setting NULL cells to 0 if asked to, as recode_map() does"""
+        recode_input = raster
+        if nulls_to_zero_first:
+            recode_input = nulls_to_zero
+            self.runModule(
+                "r.mapcalc",
+                expression="{m} = if(isnull({r}), 0, {r})".format(
+                    m=nulls_to_zero, r=raster
+                ),
+                overwrite=True,
+            )
+        self.runModule(
+            "r.recode",
+            input=recode_input,
+            output=recoded,
+            rules="-",
+            stdin_=rules,
+            overwrite=True,
+        )
+
+        expression = recode_expression(
+            raster=raster, rules=rules, nulls_to_zero=nulls_to_zero_first
+        )
+        self.assertIsNotNone(expression)
+        self.runModule(
+            "r.mapcalc",
+            expression="{m} = {e}".format(m=scored, e=expression),
+            overwrite=True,
+        )
+
+        self.assertRastersNoDifference(
+            actual=scored, reference=recoded, precision=PRECISION
+        )
+
+        # the difference of NULL cells is NULL: compare NULL cells apart
+        self.runModule(
+            "r.mapcalc",
+            expression="{m} = isnull({a}) != isnull({b})".format(
+                m=nulls_differ, a=scored, b=recoded
+            ),
+            overwrite=True,
+        )
+        self.assertRasterMinMax(map=nulls_differ, refmin=0, refmax=0)
+
+    def test_overlapping_bounds(self):
+        """The last of overlapping rules applies"""
+        self.assertRecodedAlike(values, "0:1:1\n0.5:1.5:2\n1:2:3")
+
+    def test_interpolated_rules(self):
+        """Scores in between new_low and new_high are interpolated, as
+        floating point numbers if any new value is one"""
+        self.assertRecodedAlike(values, "0:1:0:10.5\n1:2:10.5:0\n1.5:1:3:6")
+
+    def test_interpolated_integer_rules(self):
+        """Interpolated scores are truncated to integers if all new values are
+        integers, as r.recode then writes a CELL map"""
+        self.assertRecodedAlike(values, "0:1:0:10\n1:2:10:0\n1.5:1:3:6")
+        self.assertRecodedAlike(categories, "0:100:0:10")
+
+    def test_open_ended_rules(self):
+        """Open-ended rules apply only where no other rule does"""
+        self.assertRecodedAlike(categories, "1:5:0.5\n5:*:1")
+        self.assertRecodedAlike(categories, "*:10:1\n5:20:2\n*:3:4\n30:*:5")
+        self.assertRecodedAlike(values, RECREATION_POTENTIAL_CATEGORIES)
+
+    def test_null_input(self):
+        """NULL cells stay NULL, or are scored as 0 if asked for"""
+        for rules in "0:1:1:2\n1:*:3", "0:1:1:2.5\n1:*:3":
+            self.assertRecodedAlike(values_with_nulls, rules)
+            self.assertRecodedAlike(
+                values_with_nulls, rules, nulls_to_zero_first=True
+            )
+
+    def test_corine_suitability_scores(self):
+        """The default suitability scores of CORINE land cover classes"""
+        self.assertRecodedAlike(categories, SUITABILITY_SCORES)
+        self.assertRecodedAlike(
+            categories, SUITABILITY_SCORES, nulls_to_zero_first=True
+        )
+
+
+if __name__ == "__main__":
+    from grass.gunittest.main import test
+
+    test()